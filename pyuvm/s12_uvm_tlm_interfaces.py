@@ -19,10 +19,11 @@
 # different ports for each type being transferred.
 #
 # Ports have a data member named an export that implements the port
-# functionality. uvm_put_port.put() calls its export.put(). Ports get
-# their various flavors through multiple inheritance.
+# functionality. Once connected, uvm_put_port.put() is its export.put().
+# Ports get their various flavors through multiple inheritance.
 
 
+import weakref
 from pyuvm.s13_uvm_component import uvm_component
 from pyuvm.error_classes import UVMTLMConnectionError
 from pyuvm.utility_classes import UVMQueue, FIFO_DEBUG
@@ -54,19 +55,36 @@ from cocotb.queue import QueueEmpty, QueueFull
 # to avoid illegal connections
 
 # uvm_export_base provides the provided_to
-# associative array.
+# associative array. It holds weak references to the
+# ports and is only created when first used.
 
 class uvm_export_base(uvm_component):
     def __init__(self, name, parent):
         super().__init__(name, parent)
-        self.provided_to = {}
+        self._provided_to = None
+
+    @property
+    def provided_to(self):
+        """
+        :return: WeakValueDictionary of the ports connected to this
+            export, keyed by full name. An export does not keep the
+            ports that use it alive.
+        """
+        if self._provided_to is None:
+            self._provided_to = weakref.WeakValueDictionary()
+        return self._provided_to
+
+    @provided_to.setter
+    def provided_to(self, ports):
+        self._provided_to = ports
 
 
 class uvm_port_base(uvm_export_base):
     """
     A ``uvm_port_base`` is a uvm_component with a ``connect()`` function.
-    The ``connect`` function creates an ``__export`` data member that
-    implements the put/get,etc methods.
+    The ``connect`` function stores the ``export`` data member that
+    implements the put/get,etc methods and binds those methods
+    directly to the port.
 
     We'll build functionality from ``uvm_port_base`` to create the
     other combinations of ports through multiple inheritance.
@@ -92,15 +110,41 @@ class uvm_port_base(uvm_export_base):
 
     def __init__(self, name, parent):
         super().__init__(name, parent)
-        self.connected_to = {}
+        self._connected_to = None
         self.export = None
-        self.needed_methods = []
         # Compare the list of all tlm methods to the
         # methods in this class to create a list of
-        # needed
-        for method in self.__tlm_method_list:
-            if hasattr(self, method):
-                self.needed_methods.append(method)
+        # needed. The lists only depend on the class
+        # so each class computes them once and stores
+        # them in _tlm_port_methods along with the
+        # methods that connect() binds to the export.
+        cls = type(self)
+        try:
+            needed, forwarded = cls.__dict__["_tlm_port_methods"]
+        except KeyError:
+            needed = tuple(method for method in self.__tlm_method_list
+                           if hasattr(cls, method))
+            forwarded = tuple(method for method in needed
+                              if getattr(cls, method) in _FORWARDING_METHODS)
+            cls._tlm_port_methods = (needed, forwarded)
+        self.needed_methods = list(needed)
+        self._forwarded_methods = forwarded
+
+    @property
+    def connected_to(self):
+        """
+        :return: WeakValueDictionary of the exports this port
+            connects to, keyed by full name. The port still holds
+            its current export through ``export`` and the bound
+            methods, so this map is only created on demand.
+        """
+        if self._connected_to is None:
+            self._connected_to = weakref.WeakValueDictionary()
+        return self._connected_to
+
+    @connected_to.setter
+    def connected_to(self, exports):
+        self._connected_to = exports
 
     def _check_export(self, export):
         """Check that the export implements needed methods"""
@@ -117,13 +161,31 @@ class uvm_port_base(uvm_export_base):
         """
             :param export: The export that has the functions
             :raises: UVMTLMConnectionError if there is a connect error
+                or the connection would create a loop of ports
             :return: None
 
             Attach this port to the associated export.
 
+            After the connection, the port's TLM methods are the
+            export's own bound methods, so ``port.put`` is
+            ``export.put``. This holds through chains of ports
+            regardless of the order in which they are connected.
+            Exceptions raised inside the export's methods, including
+            ``AttributeError``, reach the caller unchanged. Only calls
+            on an unconnected port raise ``UVMTLMConnectionError``.
+
         """
 
         self._check_export(export)
+        # A chain of ports that leads back to this port
+        # would forward calls forever.
+        upstream = export
+        while isinstance(upstream, uvm_port_base):
+            if upstream is self:
+                raise UVMTLMConnectionError(
+                    f"Connecting {self.get_full_name()} to "
+                    f"{export.get_full_name()} creates a loop")
+            upstream = upstream.export
         try:
             self.export = export
             self.connected_to[export.get_full_name()] = export
@@ -131,6 +193,22 @@ class uvm_port_base(uvm_export_base):
         except KeyError:
             raise UVMTLMConnectionError(
                 f"Error connecting {self.get_name()} using {export}")
+        self._bind_export_methods()
+
+    def _bind_export_methods(self):
+        """
+        Replace the forwarding methods with the export's own
+        methods so that port.put() calls export.put() directly.
+        Ports already connected to this port are bound again
+        so they skip this port as well.
+        """
+        for method in self._forwarded_methods:
+            setattr(self, method, getattr(self.export, method))
+        if self._provided_to is None:
+            return
+        for port in self._provided_to.values():
+            if isinstance(port, uvm_port_base) and port.export is self:
+                port._bind_export_methods()
 
 # put
 
@@ -359,9 +437,6 @@ class uvm_get_peek_port(uvm_blocking_get_peek_port,
 
 
 class uvm_blocking_transport_port(uvm_port_base):
-    def __init__(self, name, parent):
-        super().__init__(name, parent)
-
     async def transport(self, put_data):
         """
         Puts data and blocks if there is no room, then blocks
@@ -381,10 +456,6 @@ class uvm_blocking_transport_port(uvm_port_base):
 
 
 class uvm_nonblocking_transport_port(uvm_port_base):
-
-    def __init__(self, name, parent):
-        super().__init__(name, parent)
-
     def nb_transport(self, put_data):
         """
         Non-blocking transport.  Returns a tuple with success
@@ -451,14 +522,12 @@ class uvm_analysis_port(uvm_port_base):
         Returns regardless of whether there are any subscribers.
 
         :param datum: data to send
-        :raises: UVMTLMConnectionError if export is missing
         :return: None
 
         """
+        # connect() has already checked that every
+        # subscriber has a write() method.
         for export in self.subscribers:
-            if not hasattr(export, "write"):
-                raise UVMTLMConnectionError(
-                    f"No write() method in {export}. Did you connect it?")
             export.write(datum)
 
     def connect(self, export):
@@ -466,6 +535,24 @@ class uvm_analysis_port(uvm_port_base):
         self.subscribers.append(export)
 
 
+# These port methods do nothing but call the same method in
+# the export. uvm_port_base.connect() binds the export's methods
+# in their place. Methods that subclasses override are left alone.
+_FORWARDING_METHODS = frozenset((
+    uvm_blocking_put_port.put,
+    uvm_nonblocking_put_port.try_put,
+    uvm_nonblocking_put_port.can_put,
+    uvm_blocking_get_port.get,
+    uvm_nonblocking_get_port.try_get,
+    uvm_nonblocking_get_port.can_get,
+    uvm_blocking_peek_port.peek,
+    uvm_nonblocking_peek_port.try_peek,
+    uvm_nonblocking_peek_port.can_peek,
+    uvm_blocking_transport_port.transport,
+    uvm_nonblocking_transport_port.nb_transport,
+))
+
+
 class uvm_nonblocking_put_export(uvm_export_base):
     ...
 
@@ -538,7 +625,7 @@ class uvm_blocking_master_export(uvm_blocking_put_export,
     ...
 
 
-class uvm_nonblocking_master_export(uvm_blocking_peek_export,
+class uvm_nonblocking_master_export(uvm_nonblocking_put_export,
                                     uvm_nonblocking_get_peek_export):
     ...
 
@@ -609,9 +696,9 @@ class uvm_tlm_fifo_base(uvm_component):
             A coroutine that blocks if the FIFO is full.
 
             """
-            self.logger.log(FIFO_DEBUG, f"blocking put: {item}")
+            self.logger.log(FIFO_DEBUG, "blocking put: %s", item)
             await self.queue.put(item)
-            self.logger.log(FIFO_DEBUG, f"success put {item}")
+            self.logger.log(FIFO_DEBUG, "success put %s", item)
             self.ap.write(item)
 
     #  12.2.8.1.3
@@ -652,7 +739,7 @@ class uvm_tlm_fifo_base(uvm_component):
             """
             self.logger.log(FIFO_DEBUG, "Attempting blocking get")
             item = await self.queue.get()
-            self.logger.log(FIFO_DEBUG, f"got {item}")
+            self.logger.log(FIFO_DEBUG, "got %s", item)
             self.ap.write(item)
             return item
 
@@ -688,7 +775,7 @@ class uvm_tlm_fifo_base(uvm_component):
             """
             self.logger.log(FIFO_DEBUG, "Attempting blocking peek")
             peek_data = await self.queue.peek()
-            self.logger.log(FIFO_DEBUG, f"peeked at {peek_data}")
+            self.logger.log(FIFO_DEBUG, "peeked at %s", peek_data)
             return peek_data
 
     class uvm_NonBlockingPeekExport(uvm_QueueAccessor,
@@ -740,7 +827,7 @@ class uvm_tlm_fifo_base(uvm_component):
         self.blocking_get_export = self.uvm_BlockingGetExport("blocking_get_export", self,  # noqa: E501
                                                               self.queue, self.get_ap)  # noqa: E501
         self.nonblocking_get_export = self.uvm_NonBlockingGetExport("nonblocking_get_export", self,  # noqa: E501
-                                                                    self.queue, self.put_ap)  # noqa: E501
+                                                                    self.queue, self.get_ap)  # noqa: E501
 
         self.get_export = self.uvm_GetExport("get_export", self, self.queue,
                                              self.get_ap)
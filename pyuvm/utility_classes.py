@@ -282,17 +282,25 @@ class UVMQueue(cocotb.queue.Queue):
         return self._queue[0]
 
     async def peek(self):
-        """Remove and return an item from the queue.
+        """Return an item from the queue without removing it.
         If the queue is empty, wait until an item is available.
         """
+        waited = False
         while self.empty():
             event = Event('{} peek'.format(type(self).__name__))
             self._getters.append((event, cocotb.scheduler._current_task))
             await event.wait()
+            waited = True
+        # put() wakes a single waiter. If that was this peek, the
+        # item is still in the queue, so pass the wakeup on to the
+        # next get or peek rather than leaving it blocked until the
+        # next put().
+        if waited:
+            self._wakeup_next(self._getters)
         return self.peek_nowait()
 
     def peek_nowait(self):
-        """Remove and return an item from the queue.
+        """Return an item from the queue without removing it.
         Return an item if one is immediately available, else raise
         :exc:`asyncio.QueueEmpty`.
         """
@@ -1,5 +1,5 @@
 from cocotb.clock import Clock
-from cocotb.triggers import FallingEdge
+from cocotb.triggers import FallingEdge, Timer
 import cocotb
 
 import pyuvm.utility_classes as utility_classes
@@ -154,6 +154,24 @@ async def wait_on_queue(dut):
     assert got_data == .01
     got_data = await delay_get(qq, .01)
 
+@cocotb.test()
+async def peek_and_get_one_put(dut):
+    """A single put releases both a waiting peek and a waiting get"""
+    qq = utility_classes.UVMQueue(maxsize=1)
+    peek_task = cocotb.start_soon(qq.peek())
+    get_task = cocotb.start_soon(qq.get())
+    await Timer(1, units="us")
+    assert not peek_task.done()
+    assert not get_task.done()
+    await qq.put("x")
+    await Timer(1, units="us")
+    assert peek_task.done()
+    assert get_task.done()
+    assert peek_task.result() == "x"
+    assert get_task.result() == "x"
+    assert qq.empty()
+
+
 @cocotb.test()
 async def nowait_tests(dut):
     """Test the various nowait flavors"""
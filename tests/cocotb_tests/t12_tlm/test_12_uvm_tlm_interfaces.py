@@ -1,6 +1,8 @@
 import uvm_unittest
 from pyuvm import * # pylint: disable=unused-wildcard-import
 import cocotb
+import gc
+import weakref
 from cocotb.triggers import Timer
 
 
@@ -154,6 +156,17 @@ class s12_uvm_tlm_interfaces_TestCase(uvm_unittest.uvm_TestCase):
         """
         ...
 
+    class ListSubscriber(uvm_subscriber):
+        """
+        Records everything written to its analysis_export
+        """
+        def __init__(self, name, parent):
+            super().__init__(name, parent)
+            self.data = []
+
+        def write(self, datum):
+            self.data.append(datum)
+
     # Put
 
     # Common predefined port tests: put, get, peek, get_peek, transport, master, slave
@@ -441,6 +454,81 @@ class s12_uvm_tlm_interfaces_TestCase(uvm_unittest.uvm_TestCase):
         await self.exercise_blocking_put(uvm_slave_port, self.TestSlaveExport)
         await self.exercise_blocking_get_peek(uvm_slave_port, self.TestSlaveExport)
 
+    def test_nonblocking_master_export_bases(self):
+        self.assertTrue(issubclass(uvm_nonblocking_master_export, uvm_nonblocking_put_export))
+        self.assertFalse(issubclass(uvm_nonblocking_master_export, uvm_blocking_peek_export))
+
+    def test_connect_binds_export_methods(self):
+        port = uvm_put_port("port", self.my_root)
+        export = self.TestPutExport("export", self.my_root)
+        port.connect(export)
+        self.assertEqual(export.put, port.put)
+        self.assertEqual(export.try_put, port.try_put)
+        self.assertEqual(export.can_put, port.can_put)
+
+    def test_connect_keeps_overridden_methods(self):
+        port = uvm_seq_item_port("seq_item_port", self.my_root)
+        export = uvm_seq_item_export("seq_item_export", self.my_root)
+        self.assertEqual((), port._forwarded_methods)
+        port.connect(export)
+        self.assertIs(uvm_seq_item_port.put_response,
+                      port.put_response.__func__)
+        self.assertIs(uvm_seq_item_port.item_done, port.item_done.__func__)
+
+    def test_connect_port_chain_bottom_up(self):
+        fifo = uvm_tlm_fifo("fifo", self.my_root)
+        inner = uvm_put_port("inner", self.my_root)
+        outer = uvm_put_port("outer", self.my_root)
+        outer.connect(inner)
+        inner.connect(fifo.put_export)
+        self.assertEqual(fifo.put_export.put, outer.put)
+        self.assertEqual(fifo.put_export.try_put, outer.try_put)
+        # outer follows inner when inner is reconnected
+        fifo2 = uvm_tlm_fifo("fifo2", self.my_root)
+        inner.connect(fifo2.put_export)
+        self.assertEqual(fifo2.put_export.put, outer.put)
+        self.assertEqual(fifo2.put_export.can_put, outer.can_put)
+
+    def test_connect_loop(self):
+        aa = uvm_put_port("aa", self.my_root)
+        bb = uvm_put_port("bb", self.my_root)
+        aa.connect(bb)
+        with self.assertRaises(UVMTLMConnectionError):
+            bb.connect(aa)
+        with self.assertRaises(UVMTLMConnectionError):
+            aa.connect(aa)
+        self.assertIs(bb, aa.export)
+        self.assertIsNone(bb.export)
+
+    def test_connection_maps(self):
+        port = uvm_put_port("port", self.my_root)
+        export = self.TestPutExport("export", self.my_root)
+        self.assertIsNone(port._connected_to)
+        self.assertIsNone(export._provided_to)
+        port.connect(export)
+        self.assertIsInstance(port.connected_to, weakref.WeakValueDictionary)
+        self.assertIsInstance(export.provided_to, weakref.WeakValueDictionary)
+        self.assertEqual({export.get_full_name(): export}, dict(port.connected_to))
+        self.assertEqual({port.get_full_name(): port}, dict(export.provided_to))
+        # The export does not keep a discarded port alive
+        port_name = port.get_full_name()
+        del port
+        self.my_root.clear_children()
+        del uvm_component.component_dict[port_name]
+        gc.collect()
+        self.assertEqual({}, dict(export.provided_to))
+        # The maps can still be replaced
+        export.provided_to = {}
+        self.assertEqual({}, export.provided_to)
+
+    def test_needed_methods_per_instance(self):
+        port = uvm_put_port("port", self.my_root)
+        port2 = uvm_put_port("port2", self.my_root)
+        port.needed_methods.append("get")
+        self.assertEqual(["put", "try_put", "can_put"], port2.needed_methods)
+        with self.assertRaises(UVMTLMConnectionError):
+            port.connect(self.TestPutExport("export", self.my_root))
+
     def test_uvm_tlm_fifo_size(self):
         """
         12.2.8.2.2
@@ -569,6 +657,10 @@ class s12_uvm_tlm_interfaces_TestCase(uvm_unittest.uvm_TestCase):
         pp.connect(fifo.nonblocking_put_export)
         gp.connect(fifo.nonblocking_get_export)
         pk.connect(fifo.nonblocking_peek_export)
+        get_sub = self.ListSubscriber("get_sub", self.my_root)
+        put_sub = self.ListSubscriber("put_sub", self.my_root)
+        fifo.get_ap.connect(get_sub.analysis_export)
+        fifo.put_ap.connect(put_sub.analysis_export)
         put_data = [10, 20, 30, 'c0', None]
         get_data = []
         peek_data = []
@@ -586,6 +678,9 @@ class s12_uvm_tlm_interfaces_TestCase(uvm_unittest.uvm_TestCase):
         self.assertEqual(data, put_data[0])
         await self.do_nonblocking_get(gp, get_data)
         self.assertEqual(put_data[:-1], get_data)
+        # try_get() writes only to get_ap
+        self.assertEqual(put_data, get_sub.data)
+        self.assertEqual(put_data, put_sub.data)
         # now with get_peek
         gpp = uvm_nonblocking_get_peek_port("gpp", self.my_root)
         gpp.connect(fifo.nonblocking_get_peek_export)